@@ -87,11 +87,11 @@ async def agent_chat(request: ChatRequest):
         executor = _build_executor(config, request.skills)
 
         # Offload the blocking call to a thread to avoid blocking the event loop.
-        loop = asyncio.get_running_loop()
-        result = await loop.run_in_executor(
-            None,
-            lambda: executor.chat(message=request.message, session_id=session_id,
-                                  context=request.context),
+        result = await asyncio.to_thread(
+            executor.chat,
+            message=request.message,
+            session_id=session_id,
+            context=request.context,
         )
 
         return ChatResponse(
@@ -206,7 +206,8 @@ async def agent_chat_stream(request: ChatRequest):
         if event.get("type") in ("tool_start", "tool_done"):
             tool = event.get("tool", "")
             event["display_name"] = TOOL_DISPLAY_NAMES.get(tool, tool)
-        asyncio.run_coroutine_threadsafe(queue.put(event), loop)
+        # Unbounded queue: put_nowait never blocks, so skip the per-event coroutine/Task
+        loop.call_soon_threadsafe(queue.put_nowait, event)
 
     def run_sync():
         try:
@@ -217,23 +218,17 @@ async def agent_chat_stream(request: ChatRequest):
                 progress_callback=progress_callback,
                 context=request.context,
             )
-            asyncio.run_coroutine_threadsafe(
-                queue.put({
-                    "type": "done",
-                    "success": result.success,
-                    "content": result.content,
-                    "error": result.error,
-                    "total_steps": result.total_steps,
-                    "session_id": session_id,
-                }),
-                loop,
-            )
+            loop.call_soon_threadsafe(queue.put_nowait, {
+                "type": "done",
+                "success": result.success,
+                "content": result.content,
+                "error": result.error,
+                "total_steps": result.total_steps,
+                "session_id": session_id,
+            })
         except Exception as exc:
             logger.error(f"Agent stream error: {exc}")
-            asyncio.run_coroutine_threadsafe(
-                queue.put({"type": "error", "message": str(exc)}),
-                loop,
-            )
+            loop.call_soon_threadsafe(queue.put_nowait, {"type": "error", "message": str(exc)})
 
     async def event_generator():
         # Start executor in a thread so we don't block the event loop
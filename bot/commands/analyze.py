@@ -13,10 +13,18 @@ from typing import List, Optional
 
 from bot.commands.base import BotCommand
 from bot.models import BotMessage, BotResponse
-from data_provider.base import canonical_stock_code
+from data_provider.base import canonical_stock_code, normalize_stock_code
+from src.enums import ReportType
 
 logger = logging.getLogger(__name__)
 
+# Precompiled stock code patterns (HK: HK + 5 digits, US: 1-5 letters + optional suffix)
+_HK_STOCK_RE = re.compile(r'^HK\d{5}$')
+_US_STOCK_RE = re.compile(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$')
+
+# Second-argument keywords that switch to the full report
+_FULL_REPORT_ARGS = frozenset({"full", "完整", "详细"})
+
 
 class AnalyzeCommand(BotCommand):
     """
@@ -50,51 +58,61 @@ class AnalyzeCommand(BotCommand):
         if not args:
             return "请输入股票代码"
         
-        code = args[0].upper()
+        # Accept exchange-decorated A-share input such as SH600519 / 600519.SH
+        code = normalize_stock_code(args[0]).upper()
 
         # 验证股票代码格式
         # A股：6位数字
         # 港股：HK+5位数字
         # 美股：1-5个大写字母+.+2个后缀字母
-        is_a_stock = re.match(r'^\d{6}$', code)
-        is_hk_stock = re.match(r'^HK\d{5}$', code)
-        is_us_stock = re.match(r'^[A-Z]{1,5}(\.[A-Z]{1,2})?$', code)
+        is_a_stock = len(code) == 6 and code.isdecimal()
+        is_hk_stock = _HK_STOCK_RE.match(code)
+        is_us_stock = _US_STOCK_RE.match(code)
 
         if not (is_a_stock or is_hk_stock or is_us_stock):
-            return f"无效的股票代码: {code}（A股6位数字 / 港股HK+5位数字 / 美股1-5个字母）"
+            return f"无效的股票代码: {args[0]}（A股6位数字 / 港股HK+5位数字 / 美股1-5个字母）"
         
         return None
     
     def execute(self, message: BotMessage, args: List[str]) -> BotResponse:
         """执行分析命令"""
-        code = canonical_stock_code(args[0])
+        code = canonical_stock_code(normalize_stock_code(args[0]))
         
         # 检查是否需要完整报告（默认精简，传 full/完整/详细 切换）
-        report_type = "simple"
-        if len(args) > 1 and args[1].lower() in ["full", "完整", "详细"]:
-            report_type = "full"
-        logger.info(f"[AnalyzeCommand] 分析股票: {code}, 报告类型: {report_type}")
+        report_type = ReportType.SIMPLE
+        if len(args) > 1 and args[1].lower() in _FULL_REPORT_ARGS:
+            report_type = ReportType.FULL
+        logger.info(f"[AnalyzeCommand] 分析股票: {code}, 报告类型: {report_type.value}")
         
         try:
             # 调用分析服务
             from src.services.task_service import get_task_service
-            from src.enums import ReportType
             
             service = get_task_service()
             
             # 提交异步分析任务
             result = service.submit_analysis(
                 code=code,
-                report_type=ReportType.from_str(report_type),
+                report_type=report_type,
                 source_message=message
             )
             
+            if result.get("cached"):
+                return self._format_cached_result(code, report_type, result.get("result") or {})
+
+            if result.get("in_progress"):
+                return BotResponse.markdown_response(
+                    f"⏳ **{code} 正在分析中**\n\n"
+                    f"本会话已有相同的分析任务在执行（任务 ID: `{result.get('task_id', '')[:20]}...`），"
+                    f"完成后结果将推送到本会话，请勿重复提交。"
+                )
+
             if result.get("success"):
                 task_id = result.get("task_id", "")
                 return BotResponse.markdown_response(
                     f"✅ **分析任务已提交**\n\n"
                     f"• 股票代码: `{code}`\n"
-                    f"• 报告类型: {ReportType.from_str(report_type).display_name}\n"
+                    f"• 报告类型: {report_type.display_name}\n"
                     f"• 任务 ID: `{task_id[:20]}...`\n\n"
                     f"分析完成后将自动推送结果。"
                 )
@@ -105,3 +123,16 @@ class AnalyzeCommand(BotCommand):
         except Exception as e:
             logger.error(f"[AnalyzeCommand] 执行失败: {e}")
             return BotResponse.error_response(f"分析失败: {str(e)[:100]}")
+
+    def _format_cached_result(self, code: str, report_type: ReportType, data: dict) -> BotResponse:
+        """格式化缓存命中的分析摘要"""
+        name = data.get("name") or code
+        return BotResponse.markdown_response(
+            f"📊 **{name}（{code}）最近分析结果**\n\n"
+            f"• 报告类型: {report_type.display_name}\n"
+            f"• 操作建议: {data.get('operation_advice', '-')}\n"
+            f"• 趋势预测: {data.get('trend_prediction', '-')}\n"
+            f"• 情绪评分: {data.get('sentiment_score', '-')}\n\n"
+            f"{data.get('analysis_summary', '')}\n\n"
+            f"_本会话几分钟内已分析过该股票，以上为缓存摘要；如需完整报告请发送 /analyze {code} full。_"
+        )
@@ -15,11 +15,15 @@ from typing import List, Optional
 
 from bot.commands.base import BotCommand
 from bot.models import BotMessage, BotResponse
-from data_provider.base import canonical_stock_code
+from data_provider.base import canonical_stock_code, normalize_stock_code
 from src.config import get_config
 
 logger = logging.getLogger(__name__)
 
+# Precompiled stock code patterns (HK: HK + 5 digits, US: 1-5 letters + optional suffix)
+_HK_STOCK_RE = re.compile(r"^HK\d{5}$")
+_US_STOCK_RE = re.compile(r"^[A-Z]{1,5}(\.[A-Z]{1,2})?$")
+
 # Strategy name to id mapping (CN name -> strategy id)
 STRATEGY_NAME_MAP = {
     "缠论": "chan_theory",
@@ -78,13 +82,14 @@ class AskCommand(BotCommand):
         if not args:
             return "请输入股票代码。用法: /ask <股票代码> [策略名称]\n示例: /ask 600519 用缠论分析"
 
-        code = args[0].upper()
-        is_a_stock = re.match(r"^\d{6}$", code)
-        is_hk_stock = re.match(r"^HK\d{5}$", code)
-        is_us_stock = re.match(r"^[A-Z]{1,5}(\.[A-Z]{1,2})?$", code)
+        # Accept exchange-decorated A-share input such as SH600519 / 600519.SH
+        code = normalize_stock_code(args[0]).upper()
+        is_a_stock = len(code) == 6 and code.isdecimal()
+        is_hk_stock = _HK_STOCK_RE.match(code)
+        is_us_stock = _US_STOCK_RE.match(code)
 
         if not (is_a_stock or is_hk_stock or is_us_stock):
-            return f"无效的股票代码: {code}（A股6位数字 / 港股HK+5位数字 / 美股1-5个字母）"
+            return f"无效的股票代码: {args[0]}（A股6位数字 / 港股HK+5位数字 / 美股1-5个字母）"
 
         return None
 
@@ -123,7 +128,7 @@ class AskCommand(BotCommand):
                 "⚠️ Agent 模式未开启，无法使用问股功能。\n请在配置中设置 `AGENT_MODE=true`。"
             )
 
-        code = canonical_stock_code(args[0])
+        code = canonical_stock_code(normalize_stock_code(args[0]))
         strategy_id = self._parse_strategy(args)
         strategy_text = " ".join(args[1:]).strip() if len(args) > 1 else ""
 
@@ -7,11 +7,33 @@
 显示可用命令列表和使用说明。
 """
 
-from typing import List
+from typing import Dict, List, Tuple
 
 from bot.commands.base import BotCommand
 from bot.models import BotMessage, BotResponse
 
+# Static parts of the help list, built once at import time
+_HELP_HEADER_LINES = (
+    "📚 **股票分析助手 - 命令帮助**",
+    "",
+    "可用命令：",
+    "",
+)
+
+_HELP_FOOTER_TEMPLATE = "\n".join([
+    "",
+    "---",
+    "💡 输入 {prefix}help <命令名> 查看详细用法",
+    "",
+    "**示例：**",
+    "",
+    "• {prefix}analyze 301023 - 奕帆传动",
+    "",
+    "• {prefix}market - 查看大盘复盘",
+    "",
+    "• {prefix}batch - 批量分析自选股",
+])
+
 
 class HelpCommand(BotCommand):
     """
@@ -24,6 +46,10 @@ class HelpCommand(BotCommand):
         /help         - 显示所有命令
         /help analyze - 显示 analyze 命令的详细帮助
     """
+
+    def __init__(self):
+        # Rendered help list keyed by (prefix, registered command names)
+        self._help_list_cache: Dict[Tuple[str, Tuple[str, ...]], str] = {}
     
     @property
     def name(self) -> str:
@@ -64,17 +90,17 @@ class HelpCommand(BotCommand):
         commands = dispatcher.list_commands(include_hidden=False)
         prefix = dispatcher.command_prefix
         
-        help_text = self._format_help_list(commands, prefix)
+        # The command set rarely changes, so reuse the rendered text until it does
+        cache_key = (prefix, tuple(cmd.name for cmd in commands))
+        help_text = self._help_list_cache.get(cache_key)
+        if help_text is None:
+            help_text = self._format_help_list(commands, prefix)
+            self._help_list_cache[cache_key] = help_text
         return BotResponse.markdown_response(help_text)
     
     def _format_help_list(self, commands: List[BotCommand], prefix: str) -> str:
         """格式化命令列表"""
-        lines = [
-            "📚 **股票分析助手 - 命令帮助**",
-            "",
-            "可用命令：",
-            "",
-        ]
+        lines = list(_HELP_HEADER_LINES)
         
         for cmd in commands:
             # 命令名和别名
@@ -88,19 +114,7 @@ class HelpCommand(BotCommand):
             lines.append(f"• {prefix}{cmd.name}{aliases_str} - {cmd.description}")
             lines.append("")
 
-        lines.extend([
-            "",
-            "---",
-            f"💡 输入 {prefix}help <命令名> 查看详细用法",
-            "",
-            "**示例：**",
-            "",
-            f"• {prefix}analyze 301023 - 奕帆传动",
-            "",
-            f"• {prefix}market - 查看大盘复盘",
-            "",
-            f"• {prefix}batch - 批量分析自选股",
-        ])
+        lines.append(_HELP_FOOTER_TEMPLATE.format(prefix=prefix))
         
         return "\n".join(lines)
     
@@ -49,13 +49,14 @@ class DingtalkStreamHandler:
     并调用命令分发器处理。
     """
 
+    _logger = logger
+
     def __init__(self, on_message: Callable[[BotMessage], BotResponse]):
         """
         Args:
             on_message: 消息处理回调函数，接收 BotMessage 返回 BotResponse
         """
         self._on_message = on_message
-        self._logger = logger
 
     @staticmethod
     def _truncate_log_content(text: str, max_len: int = 200) -> str:
@@ -96,8 +97,8 @@ class DingtalkStreamHandler:
 
                     if bot_message:
                         self._parent._log_incoming_message(bot_message)
-                        # 调用消息处理回调
-                        response = self._parent._on_message(bot_message)
+                        # Run the sync dispatcher in a worker thread so the stream event loop stays responsive
+                        response = await asyncio.to_thread(self._parent._on_message, bot_message)
 
                         # 发送回复
                         if response and response.text:
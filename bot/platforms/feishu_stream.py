@@ -262,6 +262,8 @@ class FeishuStreamHandler:
     并调用命令分发器处理。
     """
 
+    _logger = logger
+
     def __init__(
             self,
             on_message: Callable[[BotMessage], BotResponse],
@@ -274,7 +276,6 @@ class FeishuStreamHandler:
         """
         self._on_message = on_message
         self._reply_client = reply_client
-        self._logger = logger
 
     @staticmethod
     def _truncate_log_content(text: str, max_len: int = 200) -> str:
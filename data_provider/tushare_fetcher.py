@@ -166,10 +166,10 @@ class TushareFetcher(BaseFetcher):
             }
             res = requests.post(TUSHARE_API_URL, json=req_params, timeout=_timeout)
             if res.status_code != 200:
-                raise Exception(f"Tushare API HTTP {res.status_code}")
+                raise DataFetchError(f"Tushare API HTTP {res.status_code}")
             result = _json.loads(res.text)
             if result['code'] != 0:
-                raise Exception(result['msg'])
+                raise DataFetchError(result['msg'])
             data = result['data']
             columns = data['fields']
             items = data['items']
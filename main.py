@@ -474,6 +474,20 @@ def _is_truthy_env(var_name: str, default: str = "true") -> bool:
     value = os.getenv(var_name, default).strip().lower()
     return value not in {"0", "false", "no", "off"}
 
+
+def _install_uvloop_policy() -> None:
+    """Use uvloop for asyncio event loops when it is installed (not available on Windows)."""
+    if sys.platform == "win32":
+        return
+    try:
+        import asyncio
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("[Main] uvloop event loop policy enabled.")
+
+
 def start_bot_stream_clients(config: Config) -> None:
     """Start bot stream clients when enabled in config."""
     # 启动钉钉 Stream 客户端
@@ -523,6 +537,10 @@ def main() -> int:
     # 配置日志（输出到控制台和文件）
     setup_logging(log_prefix="stock_analysis", debug=args.debug, log_dir=config.log_dir)
 
+    # Process-wide loop policy: must precede any thread or event loop, including the one
+    # lark_oapi.ws.client creates at import time
+    _install_uvloop_policy()
+
     logger.info("=" * 60)
     logger.info("A股自选股智能分析系统 启动")
     logger.info(f"运行时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -295,7 +295,7 @@ class LLMToolAdapter:
                 openai_tc = []
                 for tc in msg["tool_calls"]:
                     tc_dict: Dict[str, Any] = {
-                        "id": tc.get("id", str(uuid.uuid4())[:8]),
+                        "id": tc["id"] if "id" in tc else uuid.uuid4().hex[:8],
                         "type": "function",
                         "function": {
                             "name": tc["name"],
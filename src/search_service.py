@@ -17,6 +17,7 @@ import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any, Optional, Tuple
 from itertools import cycle
 import requests
@@ -67,19 +68,27 @@ def _get_with_retry(
     return requests.get(url, headers=headers, params=params, timeout=timeout)
 
 
+@lru_cache(maxsize=8)
+def _get_newspaper_config(timeout: int) -> Config:
+    """
+    获取 newspaper3k 配置（按超时时间缓存，所有抓取共享同一实例）
+    """
+    config = Config()
+    config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    config.request_timeout = timeout
+    config.fetch_images = False  # 不下载图片
+    config.memoize_articles = False # 不缓存
+    # Set the language here rather than via Article kwargs, which would mutate the shared config
+    config.language = 'zh'  # 默认中文，但也支持其他
+    return config
+
+
 def fetch_url_content(url: str, timeout: int = 5) -> str:
     """
     获取 URL 网页正文内容 (使用 newspaper3k)
     """
     try:
-        # 配置 newspaper3k
-        config = Config()
-        config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        config.request_timeout = timeout
-        config.fetch_images = False  # 不下载图片
-        config.memoize_articles = False # 不缓存
-
-        article = Article(url, config=config, language='zh') # 默认中文，但也支持其他
+        article = Article(url, config=_get_newspaper_config(timeout))
         article.download()
         article.parse()
 
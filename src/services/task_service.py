@@ -16,9 +16,11 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Tuple, Union
 
 from src.enums import ReportType
 from src.storage import get_db
@@ -26,6 +28,10 @@ from bot.models import BotMessage
 
 logger = logging.getLogger(__name__)
 
+# Completed results are reused for repeat requests from the same chat within this window
+RESULT_CACHE_TTL_SECONDS = 300
+RESULT_CACHE_MAX_SIZE = 256
+
 
 class TaskService:
     """
@@ -40,11 +46,18 @@ class TaskService:
     _instance: Optional['TaskService'] = None
     _lock = threading.Lock()
 
-    def __init__(self, max_workers: int = 3):
+    def __init__(self, max_workers: int = 3, max_pending: Optional[int] = None):
         self._executor: Optional[ThreadPoolExecutor] = None
         self._max_workers = max_workers
+        # Cap queued + running analyses so a burst cannot back up the pool indefinitely
+        self._max_pending = max_pending or max_workers * 4
+        self._slots = threading.BoundedSemaphore(self._max_pending)
         self._tasks: Dict[str, Dict[str, Any]] = {}
         self._tasks_lock = threading.Lock()
+        # (code, report_type, platform, chat_id) -> (completed_at monotonic, task_id, result_data), LRU ordered
+        self._result_cache: OrderedDict[Tuple[str, str, str, str], Tuple[float, str, Dict[str, Any]]] = OrderedDict()
+        # (code, report_type, platform, chat_id) -> task_id of the analysis currently queued or running
+        self._inflight: Dict[Tuple[str, str, str, str], str] = {}
 
     @classmethod
     def get_instance(cls) -> 'TaskService':
@@ -52,7 +65,10 @@ class TaskService:
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = cls()
+                    # Size the analysis pool from MAX_WORKERS (lazy import avoids a circular dependency)
+                    from src.config import get_config
+                    max_workers = max(1, get_config().max_workers)
+                    cls._instance = cls(max_workers=max_workers)
         return cls._instance
 
     @property
@@ -90,18 +106,70 @@ class TaskService:
         if isinstance(report_type, str):
             report_type = ReportType.from_str(report_type)
 
+        # Single-flight: identical concurrent requests from the same chat share the task in progress.
+        # The report is pushed to the originating chat only, so other chats get their own task.
+        # Cache lookup and in-flight check-and-register share one critical section so a task
+        # finishing in between cannot let a duplicate analysis through.
+        key = (code, report_type.value) + self._source_context(source_message)
         task_id = f"{code}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+        with self._tasks_lock:
+            cached = self._lookup_cached_result(code, report_type, source_message)
+            running_task_id = None
+            if cached is None:
+                running_task_id = self._inflight.get(key)
+                if running_task_id is None:
+                    self._inflight[key] = task_id
+
+        if cached is not None:
+            cached_task_id, result_data = cached
+            logger.info(f"[TaskService] 命中分析缓存: {code}, task_id={cached_task_id}")
+            return {
+                "success": True,
+                "cached": True,
+                "message": "最近已分析过该股票，直接返回缓存结果",
+                "code": code,
+                "task_id": cached_task_id,
+                "report_type": report_type.value,
+                "result": result_data,
+            }
+
+        if running_task_id is not None:
+            logger.info(f"[TaskService] 股票 {code} 正在分析中，复用任务 task_id={running_task_id}")
+            return {
+                "success": True,
+                "in_progress": True,
+                "message": "该股票正在分析中，完成后将推送结果",
+                "code": code,
+                "task_id": running_task_id,
+                "report_type": report_type.value
+            }
+
+        # Reply "busy" right away instead of queueing behind long-running analyses
+        if not self._slots.acquire(blocking=False):
+            self._release_inflight(key, task_id)
+            logger.warning(f"[TaskService] 分析任务已达上限 {self._max_pending}，拒绝股票 {code} 的请求")
+            return {
+                "success": False,
+                "error": "系统繁忙，请稍后重试",
+                "code": code,
+            }
 
         # 提交到线程池
-        self.executor.submit(
-            self._run_analysis,
-            code,
-            task_id,
-            report_type,
-            source_message,
-            save_context_snapshot,
-            query_source
-        )
+        try:
+            future = self.executor.submit(
+                self._run_analysis,
+                code,
+                task_id,
+                report_type,
+                source_message,
+                save_context_snapshot,
+                query_source
+            )
+        except Exception:
+            self._slots.release()
+            self._release_inflight(key, task_id)
+            raise
+        future.add_done_callback(lambda _: self._on_task_done(key, task_id))
 
         logger.info(f"[TaskService] 已提交股票 {code} 的分析任务, task_id={task_id}, report_type={report_type.value}")
 
@@ -113,6 +181,64 @@ class TaskService:
             "report_type": report_type.value
         }
 
+    @staticmethod
+    def _source_context(source_message: Optional[BotMessage]) -> Tuple[str, str]:
+        """返回来源会话标识 (platform, chat_id)，无来源消息时为空"""
+        if source_message is None:
+            return "", ""
+        return source_message.platform or "", source_message.chat_id or ""
+
+    def _release_inflight(self, key: Tuple[str, ...], task_id: str) -> None:
+        """移除进行中标记（仅当仍指向该任务时）"""
+        with self._tasks_lock:
+            if self._inflight.get(key) == task_id:
+                del self._inflight[key]
+
+    def _on_task_done(self, key: Tuple[str, ...], task_id: str) -> None:
+        """任务结束回调：释放并发名额和进行中标记"""
+        self._slots.release()
+        self._release_inflight(key, task_id)
+
+    def _lookup_cached_result(
+        self,
+        code: str,
+        report_type: ReportType,
+        source_message: Optional[BotMessage] = None
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """返回未过期的缓存结果 (task_id, result_data)，没有则返回 None（调用方需持有 _tasks_lock）"""
+        # The cached summary stands in for a report this chat already received;
+        # full reports are never answered with it.
+        if report_type == ReportType.FULL:
+            return None
+        key = (code, report_type.value) + self._source_context(source_message)
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+        completed_at, task_id, result_data = entry
+        if time.monotonic() - completed_at > RESULT_CACHE_TTL_SECONDS:
+            del self._result_cache[key]
+            return None
+        self._result_cache.move_to_end(key)
+        return task_id, result_data
+
+    def _store_cached_result(
+        self,
+        code: str,
+        report_type: ReportType,
+        task_id: str,
+        result_data: Dict[str, Any],
+        source_message: Optional[BotMessage] = None
+    ) -> None:
+        """写入结果缓存，超出容量时淘汰最久未使用的条目"""
+        if report_type == ReportType.FULL:
+            return
+        key = (code, report_type.value) + self._source_context(source_message)
+        with self._tasks_lock:
+            self._result_cache[key] = (time.monotonic(), task_id, result_data)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > RESULT_CACHE_MAX_SIZE:
+                self._result_cache.popitem(last=False)
+
     def get_task_status(self, task_id: str) -> Optional[Dict[str, Any]]:
         """获取任务状态"""
         with self._tasks_lock:
@@ -207,6 +333,8 @@ class TaskService:
                         "result": result_data
                     })
 
+                self._store_cached_result(code, report_type, task_id, result_data, source_message)
+
                 logger.info(f"[TaskService] 股票 {code} 分析完成: {result.operation_advice}")
                 return {"success": True, "task_id": task_id, "result": result_data}
             else:
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Tests for stock code validation in the /analyze and /ask bot commands."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bot.commands.analyze import AnalyzeCommand
+from bot.commands.ask import AskCommand
+
+
+@pytest.fixture
+def command():
+    return AnalyzeCommand()
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["600519", "sh600519", "SZ000001", "600519.SH", "000001.sz", "bj920748", "HK00700", "aapl", "BRK.B"],
+)
+def test_accepts_plain_and_exchange_decorated_codes(command, code):
+    assert command.validate_args([code]) is None
+
+
+@pytest.mark.parametrize("code", ["60051", "SH60051", "600519.XX", "123456789", "¹²³⁴⁵⁶"])
+def test_rejects_invalid_codes(command, code):
+    assert command.validate_args([code]) is not None
+
+
+def test_invalid_code_error_echoes_user_input(command):
+    assert "SH60051" in command.validate_args(["SH60051"])
+
+
+def test_rejects_missing_code(command):
+    assert command.validate_args([]) == "请输入股票代码"
+
+
+@pytest.mark.parametrize("code", ["600519", "sh600519", "600519.SZ", "HK00700", "aapl"])
+def test_ask_accepts_plain_and_exchange_decorated_codes(code):
+    assert AskCommand().validate_args([code]) is None
+
+
+@pytest.mark.parametrize("code", ["SH60051", "600519.XX", "123456789", "¹²³⁴⁵⁶"])
+def test_ask_rejects_invalid_codes(code):
+    assert AskCommand().validate_args([code]) is not None
+
+
+def test_ask_invalid_code_error_echoes_user_input():
+    assert "SH60051" in AskCommand().validate_args(["SH60051"])
+
+
+def test_ask_execute_uses_normalized_code():
+    executor = MagicMock()
+    executor.chat.return_value = SimpleNamespace(success=False, error="boom")
+
+    with patch("bot.commands.ask.get_config", return_value=SimpleNamespace(agent_mode=True)), \
+            patch("src.agent.factory.build_agent_executor", return_value=executor):
+        AskCommand().execute(MagicMock(), ["sh600519"])
+
+    user_msg = executor.chat.call_args.kwargs["message"]
+    assert "600519" in user_msg
+    assert "sh600519" not in user_msg.lower()
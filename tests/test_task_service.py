@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the bot-facing TaskService."""
+
+import sys
+import threading
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from bot.models import BotMessage, ChatType
+from src.enums import ReportType
+from src.services.task_service import TaskService
+
+
+class TaskServiceTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.release = threading.Event()
+        self.service = TaskService(max_workers=1, max_pending=1)
+
+    def tearDown(self) -> None:
+        self.release.set()
+        if self.service._executor is not None:
+            self.service._executor.shutdown(wait=True)
+
+    @staticmethod
+    def _message(chat_id):
+        return BotMessage(
+            platform="feishu",
+            message_id=f"msg-{chat_id}",
+            user_id="user",
+            user_name="user",
+            chat_id=chat_id,
+            chat_type=ChatType.GROUP,
+            content="/analyze 600519",
+        )
+
+    def _lookup(self, *args):
+        with self.service._tasks_lock:
+            return self.service._lookup_cached_result(*args)
+
+    def _blocking_run(self, code, task_id, *args, **kwargs):
+        self.release.wait(timeout=5)
+        return {"success": True, "task_id": task_id}
+
+    def test_submit_rejects_when_pending_limit_reached(self) -> None:
+        with patch.object(self.service, "_run_analysis", side_effect=self._blocking_run):
+            first = self.service.submit_analysis("600519", ReportType.SIMPLE)
+            second = self.service.submit_analysis("000001", ReportType.SIMPLE)
+
+        self.assertTrue(first["success"])
+        self.assertFalse(second["success"])
+        self.assertIn("繁忙", second["error"])
+
+    def test_slot_is_released_after_task_finishes(self) -> None:
+        with patch.object(self.service, "_run_analysis", side_effect=self._blocking_run):
+            self.service.submit_analysis("600519", ReportType.SIMPLE)
+            self.release.set()
+            self.service._executor.shutdown(wait=True)
+            self.service._executor = None
+
+            result = self.service.submit_analysis("000001", ReportType.SIMPLE)
+
+        self.assertTrue(result["success"])
+
+    def test_recent_result_is_served_from_cache(self) -> None:
+        self.service._store_cached_result("600519", ReportType.SIMPLE, "task-1", {"code": "600519"})
+
+        with patch.object(self.service, "_run_analysis") as run_analysis:
+            result = self.service.submit_analysis("600519", ReportType.SIMPLE)
+
+        run_analysis.assert_not_called()
+        self.assertTrue(result["cached"])
+        self.assertEqual(result["task_id"], "task-1")
+        self.assertEqual(result["result"], {"code": "600519"})
+
+    def test_expired_or_other_report_type_is_not_cached(self) -> None:
+        self.service._store_cached_result("600519", ReportType.SIMPLE, "task-1", {"code": "600519"})
+
+        self.assertIsNone(self._lookup("600519", ReportType.FULL))
+        with patch("src.services.task_service.time.monotonic", return_value=10 ** 9):
+            self.assertIsNone(self._lookup("600519", ReportType.SIMPLE))
+
+    def test_cached_result_is_scoped_to_source_chat(self) -> None:
+        self.service._store_cached_result(
+            "600519", ReportType.SIMPLE, "task-1", {"code": "600519"}, self._message("chat-a")
+        )
+
+        self.assertIsNotNone(self._lookup("600519", ReportType.SIMPLE, self._message("chat-a")))
+        self.assertIsNone(self._lookup("600519", ReportType.SIMPLE, self._message("chat-b")))
+        self.assertIsNone(self._lookup("600519", ReportType.SIMPLE))
+
+    def test_full_report_is_never_cached(self) -> None:
+        self.service._store_cached_result("600519", ReportType.FULL, "task-1", {"code": "600519"})
+
+        self.assertEqual(len(self.service._result_cache), 0)
+        self.assertIsNone(self._lookup("600519", ReportType.FULL))
+
+    def test_concurrent_duplicate_request_reuses_running_task(self) -> None:
+        service = TaskService(max_workers=1, max_pending=4)
+        try:
+            with patch.object(service, "_run_analysis", side_effect=self._blocking_run) as run_analysis:
+                first = service.submit_analysis("600519", ReportType.SIMPLE)
+                second = service.submit_analysis("600519", ReportType.SIMPLE)
+                other_type = service.submit_analysis("600519", ReportType.FULL)
+                self.release.set()
+                service._executor.shutdown(wait=True)
+
+            self.assertTrue(second["in_progress"])
+            self.assertEqual(second["task_id"], first["task_id"])
+            self.assertNotIn("in_progress", other_type)
+            self.assertEqual(run_analysis.call_count, 2)
+            self.assertEqual(service._inflight, {})
+        finally:
+            if service._executor is not None:
+                service._executor.shutdown(wait=True)
+
+    def test_duplicate_request_from_other_chat_starts_own_task(self) -> None:
+        service = TaskService(max_workers=1, max_pending=4)
+        try:
+            with patch.object(service, "_run_analysis", side_effect=self._blocking_run) as run_analysis:
+                first = service.submit_analysis("600519", ReportType.SIMPLE, source_message=self._message("chat-a"))
+                same_chat = service.submit_analysis(
+                    "600519", ReportType.SIMPLE, source_message=self._message("chat-a")
+                )
+                other_chat = service.submit_analysis(
+                    "600519", ReportType.SIMPLE, source_message=self._message("chat-b")
+                )
+                self.release.set()
+                service._executor.shutdown(wait=True)
+
+            self.assertEqual(same_chat["task_id"], first["task_id"])
+            self.assertNotIn("in_progress", other_chat)
+            self.assertEqual(run_analysis.call_count, 2)
+        finally:
+            if service._executor is not None:
+                service._executor.shutdown(wait=True)
+
+    def test_request_after_task_finished_is_served_from_cache(self) -> None:
+        service = TaskService(max_workers=1, max_pending=4)
+        try:
+            with patch.object(service, "_run_analysis", side_effect=self._blocking_run) as run_analysis:
+                first = service.submit_analysis("600519", ReportType.SIMPLE)
+                # Task finishes between the duplicate's arrival and its lookup:
+                # result is cached and the in-flight marker is already cleared.
+                service._store_cached_result("600519", ReportType.SIMPLE, first["task_id"], {"code": "600519"})
+                with service._tasks_lock:
+                    service._inflight.clear()
+                second = service.submit_analysis("600519", ReportType.SIMPLE)
+                self.release.set()
+                service._executor.shutdown(wait=True)
+
+            self.assertTrue(second["cached"])
+            self.assertEqual(second["task_id"], first["task_id"])
+            self.assertEqual(run_analysis.call_count, 1)
+        finally:
+            if service._executor is not None:
+                service._executor.shutdown(wait=True)
+
+    def test_finished_analysis_populates_cache_for_source_chat(self) -> None:
+        service = TaskService(max_workers=1, max_pending=4)
+        pipeline = MagicMock()
+        pipeline.process_single_stock.return_value = SimpleNamespace(
+            code="600519",
+            name="贵州茅台",
+            sentiment_score=80,
+            operation_advice="持有",
+            trend_prediction="看多",
+            analysis_summary="summary",
+        )
+        try:
+            # Stand-in main module so the real _run_analysis runs without the full pipeline stack
+            fake_main = SimpleNamespace(StockAnalysisPipeline=MagicMock(return_value=pipeline))
+            with patch.dict(sys.modules, {"main": fake_main}), patch("src.config.get_config"):
+                first = service.submit_analysis(
+                    "600519", ReportType.SIMPLE, source_message=self._message("chat-a")
+                )
+                service._executor.shutdown(wait=True)
+                service._executor = None
+
+                same_chat = service.submit_analysis(
+                    "600519", ReportType.SIMPLE, source_message=self._message("chat-a")
+                )
+                other_chat = service.submit_analysis(
+                    "600519", ReportType.SIMPLE, source_message=self._message("chat-b")
+                )
+                service._executor.shutdown(wait=True)
+
+            self.assertTrue(same_chat["cached"])
+            self.assertEqual(same_chat["task_id"], first["task_id"])
+            self.assertEqual(same_chat["result"]["operation_advice"], "持有")
+            self.assertNotIn("cached", other_chat)
+            self.assertEqual(pipeline.process_single_stock.call_count, 2)
+            self.assertEqual(service._inflight, {})
+            for _ in range(4):
+                self.assertTrue(service._slots.acquire(blocking=False))
+        finally:
+            if service._executor is not None:
+                service._executor.shutdown(wait=True)
+
+
+if __name__ == "__main__":
+    unittest.main()